@@ -2,10 +2,13 @@
 """
 Aggregate multiple AIFF directories into a single Plex album.
 
-New feature:
+New features:
     • If --album is NOT supplied, the script builds an album title from
       artist, date, venue, and location (e.g. "The Example Band – 2024-09-15 –
       Red Rocks Amphitheatre – Boulder, CO").
+    • Parallel tag writes (--jobs)
+    • Optional TagLib backend (--backend taglib, needs pytaglib)
+    • Oversized cover images are downscaled if Pillow is installed
 
 Other capabilities (unchanged):
     • Optional cover art (APIC)
@@ -17,12 +20,17 @@ Other capabilities (unchanged):
 """
 
 import argparse
+import functools
+import io
+import os
 import sys
 import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Callable, cast
 
-from mutagen.aiff import AIFF
+from mutagen import PaddingInfo
+from mutagen.aiff import AIFF, AIFFFile
 from mutagen.id3 import (
     ID3,
     TIT2,
@@ -34,23 +42,49 @@ from mutagen.id3 import (
     TXXX,
     TCON,
     APIC,
+    Frame,
 )
 
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; covers are then embedded as‑is
+    Image = None  # type: ignore[assignment]
+    ImageOps = None  # type: ignore[assignment]
+
+try:
+    import taglib  # type: ignore[import-not-found]
+except ImportError:  # pytaglib is optional; mutagen is used without it
+    taglib = None
+
+# Mutagen parses and rewrites the ID3 chunk with many small reads/writes; an
+# explicit buffer on the one handle used for load + save coalesces them.
+# Keep it small: every seek to the next chunk header refills the buffer, so a
+# large one reads megabytes of audio data that are never looked at.
+_IO_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE
+
 
 # ----------------------------------------------------------------------
 # Helpers for sorting
 # ----------------------------------------------------------------------
-def _numeric_key(p: Path) -> tuple:
-    """Sort by leading integer (if any) then alphabetically."""
-    m = re.match(r"^\D*(\d+)", p.stem)
+_NUMERIC_RE = re.compile(r"^\D*(\d+)")
+
+
+@functools.lru_cache(maxsize=None)
+def _leading_int(stem: str) -> float:
+    m = _NUMERIC_RE.match(stem)
     if m:
-        return (int(m.group(1)), p.name.lower())
+        return int(m.group(1))
     else:
-        return (float("inf"), p.name.lower())
+        return float("inf")
 
 
-def _alpha_key(p: Path) -> str:
-    return p.name.lower()
+def _numeric_key(name: str) -> tuple:
+    """Sort by leading integer (if any) then alphabetically."""
+    return (_leading_int(os.path.splitext(name)[0]), name.casefold())
+
+
+def _alpha_key(name: str) -> str:
+    return name.casefold()
 
 
 SORTERS = {"numeric": _numeric_key, "alpha": _alpha_key}
@@ -75,56 +109,377 @@ def build_album_title(
 
 
 # ----------------------------------------------------------------------
-# Write tags for a single AIFF file
+# Build ID3 frames (pure – no file I/O)
 # ----------------------------------------------------------------------
-def write_tags(
-    aiff_path: Path,
+def build_static_frames(
     album: str,
     artist: str,
     date_iso: str,
     venue: Optional[str],
     location: Optional[str],
-    track_number: int,
-    total_tracks: int,
-    disc_number: int,
-    title: str,
     genre: Optional[str],
     cover_bytes: Optional[bytes],
     cover_mime: Optional[str],
-) -> None:
-    audio = AIFF(aiff_path)
-
-    if audio.tags is None:
-        audio.add_tags()
-    id3: ID3 = audio.tags
-
-    # Core metadata
-    id3[TPE1] = TPE1(encoding=3, text=artist)  # Artist
-    id3[TALB] = TALB(encoding=3, text=album)  # Album
-    id3[TDRC] = TDRC(encoding=3, text=date_iso)  # Full date
-    id3[TRCK] = TRCK(encoding=3, text=f"{track_number}/{total_tracks}")  # Track/total
-    id3[TPOS] = TPOS(encoding=3, text=str(disc_number))  # Disc number
+) -> Dict[str, Frame]:
+    """
+    Frames that are identical for every track in the album, keyed by their
+    ID3 hash key (e.g. "TPE1", "TXXX:Venue"). Built once and shared: mutagen
+    does not modify frames on add/save.
+    """
+    frames: Dict[str, Frame] = {
+        # Core metadata
+        "TPE1": TPE1(encoding=3, text=artist),  # Artist
+        "TALB": TALB(encoding=3, text=album),  # Album
+        "TDRC": TDRC(encoding=3, text=date_iso),  # Full date
+    }
 
     # Optional custom text frames
     if venue:
-        id3.add(TXXX(encoding=3, desc="Venue", text=venue))
+        frames["TXXX:Venue"] = TXXX(encoding=3, desc="Venue", text=venue)
     if location:
-        id3.add(TXXX(encoding=3, desc="Location", text=location))
-
-    # Title
-    id3[TIT2] = TIT2(encoding=3, text=title)
+        frames["TXXX:Location"] = TXXX(encoding=3, desc="Location", text=location)
 
     # Genre (may be empty)
-    id3[TCON] = TCON(encoding=3, text=genre or "")
+    frames["TCON"] = TCON(encoding=3, text=genre or "")
 
-    # Cover art (APIC) – replace any existing picture
+    # Cover art
     if cover_bytes and cover_mime:
-        id3.delall("APIC")
-        id3.add(
-            APIC(encoding=3, mime=cover_mime, type=3, desc="Cover", data=cover_bytes)
+        frames["APIC:Cover"] = APIC(
+            encoding=3, mime=cover_mime, type=3, desc="Cover", data=cover_bytes
         )
 
-    audio.save()
+    return frames
+
+
+@functools.lru_cache(maxsize=None)
+def _tpos_frame(tpos: str) -> TPOS:
+    # Every track on a disc carries the same TPOS, so one shared frame per disc.
+    return TPOS(encoding=3, text=tpos)
+
+
+def build_track_frames(
+    trck: str,
+    tpos: str,
+    title: str,
+    _TRCK: type = TRCK,
+    _TIT2: type = TIT2,
+    _tpos_frame: Callable[[str], TPOS] = _tpos_frame,
+) -> Dict[str, Frame]:
+    """
+    Frames that differ from track to track. ``trck`` ("5/27") and ``tpos``
+    ("2") arrive pre‑formatted; see process_directories().
+
+    Runs once per file, so the frame constructors are bound as defaults
+    (fast locals) instead of being looked up in module globals on each call.
+    """
+    return {
+        "TRCK": _TRCK(encoding=3, text=trck),  # Track/total
+        "TPOS": _tpos_frame(tpos),  # Disc number
+        "TIT2": _TIT2(encoding=3, text=title),  # Title
+    }
+
+
+# ----------------------------------------------------------------------
+# Compare existing tags with the frames we are about to write
+# ----------------------------------------------------------------------
+def _frame_matches(existing: Optional[Frame], frame: Frame) -> bool:
+    if existing is None:
+        # Empty text frames are dropped on save, so "absent" means "empty".
+        return not isinstance(frame, APIC) and str(frame) == ""
+    if isinstance(frame, APIC):
+        if not isinstance(existing, APIC):
+            return False
+        # mutagen sets frame fields from _framespec at runtime, so type
+        # checkers cannot see .data/.mime/.type.
+        old: Any = existing
+        new: Any = frame
+        # Length check rejects a different picture without touching the bytes.
+        return (
+            len(old.data) == len(new.data)
+            and old.mime == new.mime
+            and old.type == new.type
+            and old.data == new.data
+        )
+    return str(existing) == str(frame)
+
+
+def _stale_txxx_keys(id3: ID3, frames: Dict[str, Frame]) -> List[str]:
+    """
+    TXXX frames whose description differs from one of ours only by case,
+    e.g. "TXXX:VENUE" as written by the TagLib backend next to "TXXX:Venue".
+    """
+    ours = {key.casefold(): key for key in frames if key.startswith("TXXX:")}
+    return [
+        key
+        for key in id3.keys()
+        if key.startswith("TXXX:") and ours.get(key.casefold(), key) != key
+    ]
+
+
+def tags_match(id3: ID3, frames: Dict[str, Frame]) -> bool:
+    """True if every frame is already present with the same value."""
+    if "APIC:Cover" in frames and len(id3.getall("APIC")) != 1:
+        return False
+    if _stale_txxx_keys(id3, frames):
+        return False
+    return all(_frame_matches(id3.get(key), f) for key, f in frames.items())
+
+
+# ----------------------------------------------------------------------
+# ID3 padding policy
+# ----------------------------------------------------------------------
+def _id3_chunk_is_last(fh: BinaryIO) -> bool:
+    """
+    True if no chunk follows the ID3 chunk (or there is none yet, in which
+    case mutagen appends it). mutagen itself writes ID3 last, but other
+    taggers may place it before SSND.
+    """
+    iff = AIFFFile(fh)
+    if "ID3" not in iff:
+        return True
+    chunk = iff["ID3"]
+    fh.seek(0, os.SEEK_END)
+    return chunk.offset + chunk.size >= fh.tell()
+
+
+def _keep_padding(info: PaddingInfo) -> int:
+    """
+    For an ID3 chunk with audio behind it: keep the existing padding when
+    the new tag fits, so a tag that shrinks (e.g. a smaller cover) does not
+    shift the following chunks. Otherwise use mutagen's default.
+
+    ``info.size`` cannot make this decision – it counts from the start of
+    the ID3 chunk, so it is never 0 for an existing tag.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return info.get_default_padding()
+
+
+# ----------------------------------------------------------------------
+# Apply frames to a single AIFF file (one open, one save)
+# ----------------------------------------------------------------------
+def apply_frames(aiff_path: str, frames: Dict[str, Frame]) -> bool:
+    """Write ``frames`` to the file; return False if it was already up to date."""
+    with open(aiff_path, "rb+", buffering=_IO_BUFFER_SIZE) as fh:
+        audio = AIFF(fh)
+
+        if audio.tags is None:
+            audio.add_tags()
+        # FileType declares ``tags = None``; after add_tags() it is an ID3.
+        id3 = cast(ID3, audio.tags)
+
+        # Re-runs with unchanged metadata skip the chunk rewrite entirely.
+        if tags_match(id3, frames):
+            return False
+
+        # Cover art (APIC) – replace any existing picture, not just "Cover"
+        if "APIC:Cover" in frames:
+            id3.delall("APIC")
+
+        # Venue/Location must not pile up as case‑variant duplicates.
+        for key in _stale_txxx_keys(id3, frames):
+            del id3[key]
+
+        # Keys are the frames' hash keys, so plain assignment replaces any
+        # existing frame without going through ID3.add()'s upgrade/merge logic.
+        for key, frame in frames.items():
+            id3[key] = frame
+
+        # mutagen already patches the ID3 chunk in place when the new tag fits
+        # in the old one (padding absorbs the difference), and it appends new
+        # ID3 chunks at the end of the file, so growing a tag we created never
+        # moves the audio data.
+        # A trailing ID3 chunk uses mutagen's default padding, which also trims
+        # space left over by a larger earlier tag.
+        padding = None if _id3_chunk_is_last(fh) else _keep_padding
+        fh.seek(0)
+        audio.save(fh, padding=padding)
+        return True
+
+
+# ----------------------------------------------------------------------
+# Optional TagLib backend (C++ serialization via pytaglib)
+# ----------------------------------------------------------------------
+# TagLib property names for the text frames we write. TagLib stores unknown
+# properties as TXXX frames with an upper‑case description ("TXXX:VENUE").
+_TAGLIB_PROPERTIES = {
+    "TPE1": "ARTIST",
+    "TALB": "ALBUM",
+    "TDRC": "DATE",
+    "TRCK": "TRACKNUMBER",
+    "TPOS": "DISCNUMBER",
+    "TIT2": "TITLE",
+    "TCON": "GENRE",
+    "TXXX:Venue": "VENUE",
+    "TXXX:Location": "LOCATION",
+}
+
+
+def apply_frames_taglib(aiff_path: str, frames: Dict[str, Frame]) -> bool:
+    """
+    TagLib equivalent of apply_frames() for text‑only frame sets (no APIC).
+    Return False if the file was already up to date.
+    """
+    props = {
+        _TAGLIB_PROPERTIES[key]: [str(frame)] if str(frame) else []
+        for key, frame in frames.items()
+    }
+    with taglib.File(aiff_path) as song:
+        if all(song.tags.get(k, []) == v for k, v in props.items()):
+            return False
+        song.tags.update(props)
+        unsaved = song.save()
+    if unsaved:
+        name = os.path.basename(aiff_path)
+        print(f"[WARN] {name}: TagLib could not save {sorted(unsaved)}")
+    return True
+
+
+# ----------------------------------------------------------------------
+# Write tags for a single AIFF file
+# ----------------------------------------------------------------------
+def write_tags(
+    aiff_path: str,
+    static_frames: Dict[str, Frame],
+    trck: str,
+    tpos: str,
+    title: str,
+    use_taglib: bool = False,
+) -> bool:
+    """
+    Tag one file with the album's static frames plus its own TRCK/TPOS/TIT2.
+    This is the only write path; every mode (serial, threads, processes,
+    either backend) ends up here. Return False if nothing had to change.
+    """
+    frames = dict(static_frames)
+    frames.update(build_track_frames(trck, tpos, title))
+    if use_taglib:
+        return apply_frames_taglib(aiff_path, frames)
+    return apply_frames(aiff_path, frames)
+
+
+# ----------------------------------------------------------------------
+# Per‑album writer: everything that is fixed for the run is bound once
+# ----------------------------------------------------------------------
+TrackTask = tuple[str, str, int, int, str]  # (path, name, disc, track, title)
+
+
+def make_track_writer(
+    static_frames: Dict[str, Frame],
+    trck_strs: List[str],
+    tpos_strs: List[str],
+    use_taglib: bool = False,
+) -> Callable[[TrackTask], bool]:
+    """
+    Return ``write(task) -> bool`` specialised for one album. Optional
+    fields were already resolved by build_static_frames(), so per file this
+    only builds TRCK/TPOS/TIT2 and saves. ``trck_strs``/``tpos_strs`` hold the
+    pre‑formatted TRCK/TPOS text, indexed by track/disc number − 1.
+    """
+
+    def write(task: TrackTask) -> bool:
+        path, _name, disc_number, track_number, title = task
+        return write_tags(
+            aiff_path=path,
+            static_frames=static_frames,
+            trck=trck_strs[track_number - 1],
+            tpos=tpos_strs[disc_number - 1],
+            title=title,
+            use_taglib=use_taglib,
+        )
+
+    return write
+
+
+# Process‑pool worker: the writer is built once per worker by the
+# initializer, so the (possibly multi‑MB) cover is not pickled per task.
+_worker_write: Optional[Callable[[TrackTask], bool]] = None
+
+
+def _init_worker(
+    static_frames: Dict[str, Frame],
+    trck_strs: List[str],
+    tpos_strs: List[str],
+    use_taglib: bool,
+) -> None:
+    global _worker_write
+    _worker_write = make_track_writer(static_frames, trck_strs, tpos_strs, use_taglib)
+
+
+def _write_one(task: TrackTask) -> bool:
+    assert _worker_write is not None, "_init_worker() was not run"
+    return _worker_write(task)
+
+
+# ----------------------------------------------------------------------
+# Load cover art (cached by file fingerprint)
+# ----------------------------------------------------------------------
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+# Covers larger than this (on either side) are shrunk before embedding, since
+# the image is held in memory and copied into every track's ID3 chunk.
+_MAX_COVER_PX = 1500
+
+
+def _sniff_image_mime(head: bytes) -> Optional[str]:
+    """Identify JPEG/PNG from the leading magic bytes."""
+    if head.startswith(_JPEG_MAGIC):
+        return "image/jpeg"
+    if head.startswith(_PNG_MAGIC):
+        return "image/png"
+    return None
+
+
+def _downscale_cover(data: bytes, mime: str) -> bytes:
+    """Shrink an oversized cover to _MAX_COVER_PX (no‑op without Pillow)."""
+    if Image is None:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if max(img.size) <= _MAX_COVER_PX:
+                return data
+            # The re-encoded image carries no EXIF, so apply the Orientation
+            # tag to the pixels first – otherwise phone photos end up sideways.
+            # exif_transpose() decodes the image, so request JPEG draft
+            # (DCT‑scaled) decoding up front, as thumbnail() would have.
+            img.draft(None, (2 * _MAX_COVER_PX, 2 * _MAX_COVER_PX))
+            upright = ImageOps.exif_transpose(img)
+            upright.thumbnail((_MAX_COVER_PX, _MAX_COVER_PX))
+            out = io.BytesIO()
+            if mime == "image/png":
+                upright.save(out, format="PNG", optimize=True)
+            else:
+                upright.convert("RGB").save(out, format="JPEG", quality=90)
+            size = upright.size
+    except (OSError, Image.DecompressionBombError) as exc:
+        # Pillow refuses to decode very large images; embed those unchanged,
+        # exactly as without Pillow.
+        print(f"[WARN] Could not downscale cover image: {exc}")
+        return data
+    print(f"[INFO] Downscaled cover art to {size[0]}x{size[1]}")
+    return out.getvalue()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_cover(path_str: str, mtime_ns: int, size: int) -> tuple[bytes, str]:
+    # mtime_ns/size are only part of the cache key: an edited file misses.
+    with open(path_str, "rb") as f:
+        # Probe the magic bytes before pulling in the rest of the image.
+        head = f.read(16)
+        mime = _sniff_image_mime(head)
+        if mime is None:
+            print("[WARN] Unknown cover image type; defaulting to image/jpeg")
+            mime = "image/jpeg"
+        data = head + f.read()
+    return _downscale_cover(data, mime), mime
+
+
+def load_cover(cover_path: Path) -> tuple[bytes, str]:
+    """Return (image bytes, MIME type), re-reading only if the file changed."""
+    st = os.stat(cover_path)
+    return _load_cover(str(cover_path), st.st_mtime_ns, st.st_size)
 
 
 # ----------------------------------------------------------------------
@@ -132,13 +487,109 @@ def write_tags(
 # ----------------------------------------------------------------------
 def load_tracklist(path: Path) -> List[str]:
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-        return [ln.strip() for ln in lines if ln.strip()]
+        # One pass over the file; each line is stripped once.
+        with path.open("r", encoding="utf-8") as f:
+            return [s for ln in f if (s := ln.strip())]
     except Exception as exc:
         print(f"[ERROR] Could not read tracklist file '{path}': {exc}")
         sys.exit(1)
 
 
+# ----------------------------------------------------------------------
+# Enumerate AIFF files (os.scandir – entry type comes from the dir read)
+# ----------------------------------------------------------------------
+# "FORM" + chunk size + "AIFF" – anything shorter cannot be parsed.
+_MIN_AIFF_SIZE = 12
+_AIFF_SUFFIXES = (".aiff", ".aif")
+
+
+def _is_aiff(entry: os.DirEntry) -> bool:
+    """
+    AIFF candidates only: macOS AppleDouble "._" companions and truncated
+    files (partial copies) are skipped here instead of failing in AIFF().
+    The size check costs one stat per matching name (outside Windows,
+    DirEntry does not cache it), so the cheap name checks run first. It
+    follows symlinks, so a link is judged by the file it points to. A file
+    that vanishes before it is stat'ed is simply not a candidate.
+    """
+    name = entry.name
+    if name.startswith("._") or not name.lower().endswith(_AIFF_SUFFIXES):
+        return False
+    try:
+        return (
+            entry.is_file()
+            and entry.stat().st_size >= _MIN_AIFF_SIZE
+        )
+    except OSError:
+        return False
+
+
+def count_tracks(root: Path, dirs: List[str]) -> int:
+    """
+    Cheap pre‑scan that only tallies AIFF entries (no Path objects), so the
+    total track count is known before any file is tagged. It also validates
+    every folder up front: if any is missing, all of them are reported and
+    the run stops before a single tag is written.
+    """
+    root_str = os.fspath(root)
+    total = 0
+    missing: List[str] = []
+    for subdir in dirs:
+        folder = os.path.join(root_str, subdir)
+        try:
+            it = os.scandir(folder)
+        except (FileNotFoundError, NotADirectoryError):
+            missing.append(folder)
+            continue
+        with it:
+            total += sum(1 for e in it if _is_aiff(e))
+
+    if missing:
+        for folder in missing:
+            print(f"[ERROR] Folder not found: {folder}")
+        sys.exit(1)
+    return total
+
+
+def iter_tracks(
+    root: Path, dirs: List[str], sort_mode: str
+) -> Iterator[tuple[str, str, int, int]]:
+    """
+    Lazily yield (path, name, disc_number, track_number), one folder at a
+    time, so tagging can start before later folders are enumerated. Path and
+    name are the strings os.scandir already produced – no pathlib objects.
+    Folders are assumed to exist (count_tracks() checked them); one that
+    vanishes mid‑run raises rather than silently shifting track numbers.
+    """
+    sorter: Callable[[str], Any] = SORTERS.get(sort_mode, _alpha_key)
+    root_str = os.fspath(root)
+    track_number = 1
+    for disc_idx, subdir in enumerate(dirs, start=1):
+        with os.scandir(os.path.join(root_str, subdir)) as it:
+            entries = [e for e in it if _is_aiff(e)]
+
+        # Sort keys come straight from the entry name.
+        entries.sort(key=lambda e: sorter(e.name))
+        for e in entries:
+            yield e.path, e.name, disc_idx, track_number
+            track_number += 1
+
+
+# ----------------------------------------------------------------------
+# Worker sizing
+# ----------------------------------------------------------------------
+# All discs normally live on one volume, and per‑volume metadata locking
+# (notably on APFS) makes more than ~4 concurrent writers slower, not faster.
+_MAX_IO_WORKERS = 4
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (honours taskset/cgroup affinity on Linux)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 # ----------------------------------------------------------------------
 # Main processing routine
 # ----------------------------------------------------------------------
@@ -154,85 +605,169 @@ def process_directories(
     cover_path: Optional[Path],
     sort_mode: str,
     track_titles: List[str],
+    jobs: int = 4,
+    sync: bool = False,
+    processes: bool = False,
+    backend: str = "mutagen",
 ) -> None:
     """
     Walk each supplied sub‑folder in order, rewrite tags, and keep a global
     track counter so Plex sees a single, consecutive list.
+
+    Tag writes are independent per file, so they are dispatched to a thread
+    pool of up to ``jobs`` workers; ``jobs=1`` keeps the original serial path.
+    With ``processes`` a process pool is used instead, so mutagen's CPU‑bound
+    ID3 parsing/serialization runs on several cores. ``backend="taglib"``
+    writes through pytaglib when it is installed and no cover is embedded.
+    With ``sync`` a single os.sync() is issued once all files are written.
     """
 
     # ------------------------------------------------------------------
-    # 1️⃣ Gather *all* AIFF files first so we know the total count.
+    # 1️⃣ Load cover art (if supplied) in the background while the folders
+    #    are counted – the two reads overlap instead of running back to back.
     # ------------------------------------------------------------------
-    all_files: List[tuple[Path, int]] = []  # (file_path, disc_number)
-    for disc_idx, subdir in enumerate(dirs, start=1):
-        folder = root / subdir
-        if not folder.is_dir():
-            print(f"[WARN] Skipping missing folder: {folder}")
-            continue
-
-        sorter: Callable[[Path], any] = SORTERS.get(sort_mode, _alpha_key)
-        files = sorted(folder.glob("*.aiff"), key=sorter)
-        for f in files:
-            all_files.append((f, disc_idx))
-
-    total_tracks = len(all_files)
-    if total_tracks == 0:
-        print("[ERROR] No AIFF files found in any of the supplied directories.")
+    if cover_path and not cover_path.is_file():
+        print(f"[ERROR] Cover image not found: {cover_path}")
         sys.exit(1)
 
-    # ------------------------------------------------------------------
-    # 2️⃣ Load cover art (if supplied) once.
-    # ------------------------------------------------------------------
-    cover_bytes: Optional[bytes] = None
-    cover_mime: Optional[str] = None
-    if cover_path:
-        if not cover_path.is_file():
-            print(f"[ERROR] Cover image not found: {cover_path}")
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        cover_future = loader.submit(load_cover, cover_path) if cover_path else None
+
+        # --------------------------------------------------------------
+        # 2️⃣ Count AIFF files first so we know the total.
+        # --------------------------------------------------------------
+        total_tracks = count_tracks(root, dirs)
+        if total_tracks == 0:
+            print("[ERROR] No AIFF files found in any of the supplied directories.")
             sys.exit(1)
-        cover_bytes = cover_path.read_bytes()
-        ext = cover_path.suffix.lower()
-        if ext in {".jpg", ".jpeg"}:
-            cover_mime = "image/jpeg"
-        elif ext == ".png":
-            cover_mime = "image/png"
+        # TRCK/TPOS text for every track/disc, formatted once up front.
+        trck_strs = [f"{i}/{total_tracks}" for i in range(1, total_tracks + 1)]
+        tpos_strs = [str(d) for d in range(1, len(dirs) + 1)]
+
+        cover_bytes: Optional[bytes] = None
+        cover_mime: Optional[str] = None
+        if cover_future is not None:
+            cover_bytes, cover_mime = cover_future.result()
+
+    # Album‑wide frames (artist, album, date, genre, cover…) are built once.
+    static_frames = build_static_frames(
+        album=album,
+        artist=artist,
+        date_iso=date_iso,
+        venue=venue,
+        location=location,
+        genre=genre,
+        cover_bytes=cover_bytes,
+        cover_mime=cover_mime,
+    )
+
+    use_taglib = False
+    if backend == "taglib":
+        if taglib is None:
+            print("[WARN] pytaglib is not installed; falling back to mutagen")
+        elif "APIC:Cover" in static_frames:
+            print("[WARN] TagLib backend does not embed cover art; using mutagen")
         else:
-            print("[WARN] Unknown cover image type; defaulting to image/jpeg")
-            cover_mime = "image/jpeg"
+            use_taglib = True
 
     # ------------------------------------------------------------------
-    # 3️⃣ Iterate over the collected list, assign numbers, write tags.
+    # 3️⃣ Stream (file, disc, track, title) as each folder is enumerated.
     # ------------------------------------------------------------------
-    global_counter = 1
-    title_idx = 0
-
-    for file_path, disc_number in all_files:
-        # Choose title from tracklist if available, else fallback to filename stem
-        if title_idx < len(track_titles):
-            title = track_titles[title_idx]
-            title_idx += 1
-        else:
-            title = file_path.stem
-
-        write_tags(
-            aiff_path=file_path,
-            album=album,
-            artist=artist,
-            date_iso=date_iso,
-            venue=venue,
-            location=location,
-            track_number=global_counter,
-            total_tracks=total_tracks,
-            disc_number=disc_number,
-            title=title,
-            genre=genre,
-            cover_bytes=cover_bytes,
-            cover_mime=cover_mime,
-        )
-        print(
-            f"  • {file_path.name} → Track {global_counter}/{total_tracks}, "
+    # Tracklist titles, padded to one slot per track; None → filename stem.
+    titles: List[Optional[str]] = list(track_titles[:total_tracks])
+    titles += [None] * (total_tracks - len(titles))
+
+    def _tasks() -> Iterator[TrackTask]:
+        for (path, name, disc_number, track_number), title in zip(
+            iter_tracks(root, dirs, sort_mode), titles
+        ):
+            yield path, name, disc_number, track_number, (
+                title or os.path.splitext(name)[0]
+            )
+
+    _write = make_track_writer(static_frames, trck_strs, tpos_strs, use_taglib)
+
+    # Progress lines are buffered and written once per disc, instead of one
+    # small stdout write (and flush, on a terminal) per file.
+    log_buf: List[str] = []
+    log_disc = 0
+
+    def _flush_log() -> None:
+        if log_buf:
+            sys.stdout.write("\n".join(log_buf) + "\n")
+            sys.stdout.flush()
+            log_buf.clear()
+
+    def _report(task: TrackTask, written: bool) -> None:
+        nonlocal log_disc
+        _path, name, disc_number, track_number, title = task
+        if disc_number != log_disc:
+            _flush_log()
+            log_disc = disc_number
+        log_buf.append(
+            f"  • {name} → Track {track_number}/{total_tracks}, "
             f"Disc {disc_number}, Title: {title}"
+            + ("" if written else " (unchanged)")
         )
-        global_counter += 1
+
+    # ------------------------------------------------------------------
+    # 4️⃣ Write tags – serially for --jobs 1, otherwise on a worker pool.
+    # ------------------------------------------------------------------
+    cpus = _available_cpus()
+    workers = min(jobs, _MAX_IO_WORKERS, cpus * 2)
+    if processes:
+        workers = min(jobs, _MAX_IO_WORKERS, cpus)
+    # Never start idle workers – each process pays a spawn + import cost.
+    workers = min(workers, total_tracks)
+
+    written_count = 0
+    try:
+        if workers <= 1:
+            for task in _tasks():
+                written = _write(task)
+                _report(task, written)
+                written_count += written
+        else:
+            executor: Executor
+            write_fn: Callable[[TrackTask], bool]
+            if processes:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(static_frames, trck_strs, tpos_strs, use_taglib),
+                )
+                write_fn = _write_one
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+                write_fn = _write
+
+            with executor:
+                # Submitting while iterating lets early folders be tagged while
+                # later ones are still being listed.
+                pending = [
+                    (task, executor.submit(write_fn, task)) for task in _tasks()
+                ]
+                # Report in track order; .result() re-raises any worker exception.
+                for task, future in pending:
+                    try:
+                        written = future.result()
+                    except BaseException:
+                        # Stop at the failing file like the serial loop: writes
+                        # that have not started yet are dropped, not run.
+                        executor.shutdown(cancel_futures=True)
+                        raise
+                    _report(task, written)
+                    written_count += written
+    finally:
+        # Show what was done even if a file failed part‑way through.
+        _flush_log()
+
+    # ------------------------------------------------------------------
+    # 5️⃣ Optionally flush all rewritten files with one sync, rather than
+    #    paying an fsync per file.
+    # ------------------------------------------------------------------
+    if sync and written_count:
+        os.sync()
 
 
 # ----------------------------------------------------------------------
@@ -275,7 +810,8 @@ def build_parser() -> argparse.ArgumentParser:
         required=True,
         help=(
             "Comma‑separated list of sub‑folder names to merge, in order "
-            "(e.g. cd1,cd2,bonus). The order determines disc numbers."
+            "(e.g. cd1,cd2,bonus). The order determines disc numbers; all "
+            "folders must exist."
         ),
     )
     p.add_argument(
@@ -289,27 +825,80 @@ def build_parser() -> argparse.ArgumentParser:
         default="alpha",
         help="How to sort files inside each folder (default: alpha).",
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help=(
+            "Number of files to tag in parallel (default: 4, also the "
+            "maximum – more writers on one volume, e.g. APFS, is slower). "
+            "Use 1 on spinning disks where concurrent seeks hurt."
+        ),
+    )
+    p.add_argument(
+        "--processes",
+        action="store_true",
+        help=(
+            "Run the --jobs workers as processes instead of threads. Helps "
+            "large box sets, where mutagen's ID3 encoding is CPU‑bound."
+        ),
+    )
+    p.add_argument(
+        "--backend",
+        choices=["mutagen", "taglib"],
+        default="mutagen",
+        help=(
+            "Tag‑writing library (default: mutagen). 'taglib' uses the "
+            "optional pytaglib C++ bindings for faster text‑only runs; it "
+            "falls back to mutagen when --cover is given or pytaglib is "
+            "missing, and stores Venue/Location as TXXX:VENUE/LOCATION."
+        ),
+    )
+    if hasattr(os, "sync"):
+        p.add_argument(
+            "--sync",
+            action="store_true",
+            help=(
+                "Flush all rewritten files to disk with a single sync at the "
+                "end. Files are never fsynced individually, so without this "
+                "the OS decides when tags reach disk and a crash or unplugged "
+                "drive shortly after the run can lose them."
+            ),
+        )
     return p
 
 
+def _user_path(arg: str) -> Path:
+    """
+    Expand ~ and normalise the path lexically. Unlike Path.resolve(), this
+    makes no filesystem calls (no getcwd/lstat per component); symlinks are
+    left for the OS to follow when the path is opened.
+    """
+    return Path(os.path.normpath(os.path.expanduser(arg)))
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    root_path = Path(args.root).expanduser().resolve()
+    root_path = _user_path(args.root)
     if not root_path.is_dir():
         print(f"[ERROR] Root path does not exist or is not a directory: {root_path}")
         sys.exit(1)
 
-    dir_list = [d.strip() for d in args.dirs.split(",") if d.strip()]
+    dir_list = [s for d in args.dirs.split(",") if (s := d.strip())]
     if not dir_list:
         print("[ERROR] No valid directories supplied via --dirs")
         sys.exit(1)
 
+    if args.jobs < 1:
+        print(f"[ERROR] --jobs must be at least 1 (got {args.jobs})")
+        sys.exit(1)
+
     # Load optional track‑list
     track_titles: List[str] = []
     if args.tracklist:
-        tracklist_path = Path(args.tracklist).expanduser().resolve()
+        tracklist_path = _user_path(args.tracklist)
         if not tracklist_path.is_file():
             print(f"[ERROR] Tracklist file not found: {tracklist_path}")
             sys.exit(1)
@@ -318,7 +907,7 @@ def main() -> None:
     # Resolve optional cover path
     cover_path: Optional[Path] = None
     if args.cover:
-        cover_path = Path(args.cover).expanduser().resolve()
+        cover_path = _user_path(args.cover)
 
     # ------------------------------------------------------------------
     # Determine the final album title (user‑supplied or auto‑generated)
@@ -350,6 +939,10 @@ def main() -> None:
         cover_path=cover_path,
         sort_mode=args.sort,
         track_titles=track_titles,
+        jobs=args.jobs,
+        sync=getattr(args, "sync", False),
+        processes=args.processes,
+        backend=args.backend,
     )
 
     print(